@@ -1,6 +1,5 @@
 import os
-from datetime import datetime
-from flask import Flask, jsonify, render_template
+from flask import Flask, render_template
 
 from monitor import Monitor
 
@@ -17,10 +16,8 @@ def index():
 
 @app.get("/api/status")
 def api_status():
-    data = monitor.get_status()
-    data["updated_at_iso"] = datetime.utcfromtimestamp(data["updated_at"]).isoformat() + "Z"
-    return jsonify(data)
+    return app.response_class(monitor.get_status_json(), mimetype="application/json")
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 8000)), debug=True)
+    app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 8000)), threaded=True)
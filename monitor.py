@@ -1,19 +1,155 @@
+import io
+import asyncio
 import os
+import re
+import csv
+import json
+import shlex
+import copy
 import time
+import atexit
 import yaml
 import socket
 import threading
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ALL_COMPLETED, Future, ThreadPoolExecutor, wait
 
 import paramiko
 
+try:
+    import asyncssh
+except ImportError:
+    asyncssh = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 NVIDIA_SMI_QUERY = (
     "nvidia-smi --query-gpu=index,name,uuid,utilization.gpu,"
     "memory.total,memory.used,temperature.gpu --format=csv,noheader,nounits"
 )
 
+# Remote hosts keep one looping nvidia-smi per user. Its files live in a private
+# 0700 directory ($XDG_RUNTIME_DIR when set, so they do not survive a reboot); each
+# sample is staged in a temp file and renamed into place once the next block
+# (GPU index 0) starts.
+REMOTE_MAX_AGE_SECONDS = 3
+REMOTE_IDLE_SECONDS = 600
+_REMOTE_DIR_SETUP = (
+    'd="${XDG_RUNTIME_DIR:-/tmp}/gpumon-$(id -u)"; mkdir -m 700 "$d" 2>/dev/null; '
+    '[ -d "$d" ] && [ ! -L "$d" ] && [ -O "$d" ] && chmod 700 "$d"'
+)
+# The sampler exits once no poll has touched $d/seen for REMOTE_IDLE_SECONDS (checked once a minute).
+_REMOTE_LOOP = (
+    'while IFS= read -r l; do case "$l" in "0,"*) [ -s "$f.tmp" ] && mv -f "$f.tmp" "$f"; '
+    "n=$((n + 1)); if [ $n -ge 60 ]; then n=0; "
+    f'[ $(( $(date +%s) - $(stat -c %Y "$d/seen" 2>/dev/null || echo 0) )) -gt {REMOTE_IDLE_SECONDS} ] && break; '
+    'fi;; esac; printf "%s\\n" "$l" >>"$f.tmp"; done'
+)
+_REMOTE_SAMPLER = (
+    'd="$1"; echo $$ >"$d/pid"; f="$d/gpus.csv"; rm -f "$f.tmp"; n=0; '
+    + NVIDIA_SMI_QUERY.replace("nvidia-smi ", "nvidia-smi --loop-ms=1000 ", 1)
+    + " 2>/dev/null | "
+    + _REMOTE_LOOP
+    + '; rm -f "$d/pid"'
+)
+# The recorded pid must still be a sampler: a bare kill -0 would accept a reused pid.
+# The whole group is detached from the caller's stdio so bash does not hold the channel open.
+REMOTE_DAEMON_CMD = (
+    "{ "
+    + _REMOTE_DIR_SETUP
+    + ' && { p=$(cat "$d/pid" 2>/dev/null); [ -n "$p" ] && grep -aq loop-ms "/proc/$p/cmdline" 2>/dev/null '
+    + '|| { : >"$d/seen"; exec nohup sh -c '
+    + shlex.quote(_REMOTE_SAMPLER)
+    + ' gpumon "$d"; }; }; } </dev/null >/dev/null 2>&1 &'
+)
+# Serve the sampler's file while it is fresh; otherwise (re)start it and query directly.
+REMOTE_QUERY = (
+    f'if {_REMOTE_DIR_SETUP} && : >"$d/seen" && '
+    f'[ $(( $(date +%s) - $(stat -c %Y "$d/gpus.csv" 2>/dev/null || echo 0) )) -le {REMOTE_MAX_AGE_SECONDS} ]; '
+    f'then cat "$d/gpus.csv"; else {REMOTE_DAEMON_CMD} {NVIDIA_SMI_QUERY}; fi'
+)
+# exec_command and asyncssh run commands through the user's login shell, which may not be POSIX.
+REMOTE_DAEMON_CMD_SH = "sh -c " + shlex.quote(REMOTE_DAEMON_CMD)
+REMOTE_QUERY_CMD = "sh -c " + shlex.quote(REMOTE_QUERY)
+SHELL_SENTINEL = b"__END__"
+SHELL_SENTINEL_RE = re.compile(re.escape(SHELL_SENTINEL) + rb"(\d+)\n")
+# Unreachable hosts wait this long before asyncssh is tried again; doubles per failure.
+ASYNC_RETRY_MIN_SECONDS = 30
+ASYNC_RETRY_MAX_SECONDS = 600
+
+_GPU_KEYS = (
+    "index",
+    "name",
+    "uuid",
+    "utilization_gpu",
+    "memory_total_mb",
+    "memory_used_mb",
+    "temperature_c",
+    "memory_used_pct",
+    "busy",
+)
+
+_CONNECT_COMMON: Dict[str, Any] = {
+    "key_filename": None,
+    "disabled_algorithms": {"pubkeys": ("ssh-dss",)},
+}
+_NO_AGENT: Dict[str, Any] = {"allow_agent": False, "look_for_keys": False}
+
+# Hosts with fewer GPUs than this keep the scalar busy check.
+NUMPY_MIN_GPUS = 4
+
+_YAML_CACHE: Dict[str, Tuple[float, int, Dict[str, Any]]] = {}
+
+_PKEY_CACHE: Dict[Tuple[str, int, float], paramiko.PKey] = {}
+
+_NVML_LOCK = threading.Lock()
+_NVML_STATE: Optional[bool] = None
+
+
+def _nvml_available() -> bool:
+    global _NVML_STATE
+    if pynvml is None:
+        return False
+    with _NVML_LOCK:
+        if _NVML_STATE is None:
+            try:
+                pynvml.nvmlInit()
+                _NVML_STATE = True
+            except Exception:  # noqa: BLE001
+                _NVML_STATE = False
+    return _NVML_STATE
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+# nvidia-smi ran on a connected host and failed; retrying other credentials will not help.
+class RemoteCommandError(RuntimeError):
+    pass
+
 
 @dataclass
 class Device:
@@ -39,14 +175,85 @@ class Monitor:
         self.busy_util_pct = int(self.config.get("busy_util_pct", 70))
         self.ssh_timeout_seconds = int(self.config.get("ssh_timeout_seconds", 8))
         self.devices = self._load_devices()
+        self._local_names = frozenset({"localhost", "127.0.0.1", socket.gethostname(), socket.getfqdn()})
+
+        # (timestamp, data, serialized data); replaced wholesale so readers need no lock.
+        self._snapshot: Optional[Tuple[float, Dict[str, Any], bytes]] = None
+        self._refresh_lock = threading.Lock()
+        self._refresh_inflight: Optional[Future] = None
+        self._pending_fetches: Dict[str, Future] = {}
+        self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gpumon-refresh")
+        self._pool = ThreadPoolExecutor(
+            max_workers=min(16, max(1, len(self.devices))), thread_name_prefix="gpumon"
+        )
 
-        self._cache_lock = threading.Lock()
-        self._cache_ts = 0.0
-        self._cache_data: Optional[Dict[str, Any]] = None
+        self._ssh_clients: Dict[str, paramiko.SSHClient] = {}
+        self._ssh_shells: Dict[str, paramiko.Channel] = {}
+        self._ssh_locks: Dict[str, threading.Lock] = {
+            self._client_key(d): threading.Lock() for d in self.devices
+        }
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_conns: Dict[str, Any] = {}
+        self._async_shells: Dict[str, Any] = {}
+        self._async_locks: Dict[str, asyncio.Lock] = {}
+        # Hosts asyncssh cannot authenticate to stay on the paramiko / system ssh chain;
+        # hosts it could not reach go back to asyncssh after (retry_at, delay).
+        self._async_failed: set = set()
+        self._async_retry: Dict[str, Tuple[float, float]] = {}
+        # Started by the first _submit_fetch, so a gunicorn --preload master forks with no threads.
+        self._loop_lock = threading.Lock()
+
+        atexit.register(self.close)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset_pools)
+
+    def _reset_pools(self) -> None:
+        # Worker threads, locks and paramiko transports are not usable in a forked child.
+        self._refresh_lock = threading.Lock()
+        self._refresh_inflight = None
+        self._pending_fetches = {}
+        self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gpumon-refresh")
+        self._pool = ThreadPoolExecutor(
+            max_workers=min(16, max(1, len(self.devices))), thread_name_prefix="gpumon"
+        )
+        self._ssh_clients = {}
+        self._ssh_shells = {}
+        self._ssh_locks = {self._client_key(d): threading.Lock() for d in self.devices}
+        self._async_conns = {}
+        self._async_shells = {}
+        self._async_locks = {}
+        self._async_failed = set()
+        self._async_retry = {}
+        self._loop_lock = threading.Lock()
+        self._loop = None
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="gpumon-loop", daemon=True).start()
+            return self._loop
+
+    def close(self) -> None:
+        self._refresh_executor.shutdown(wait=False)
+        self._pool.shutdown(wait=False)
+        if self._loop is not None:
+            for key in list(self._async_conns):
+                self._loop.call_soon_threadsafe(self._drop_async, key)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        for key in list(self._ssh_clients):
+            self._drop_client(key)
 
     def _load_config(self) -> Dict[str, Any]:
+        st = os.stat(self.config_path)
+        cached = _YAML_CACHE.get(self.config_path)
+        if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            return copy.deepcopy(cached[2])
         with open(self.config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            config = yaml.load(f, Loader=SafeLoader) or {}
+        _YAML_CACHE[self.config_path] = (st.st_mtime, st.st_size, config)
+        return copy.deepcopy(config)
 
     def _load_devices(self) -> List[Device]:
         devices = []
@@ -87,61 +294,271 @@ class Monitor:
         return devices
 
     def get_status(self) -> Dict[str, Any]:
-        now = time.time()
-        with self._cache_lock:
-            if self._cache_data and (now - self._cache_ts) < self.refresh_seconds:
-                return self._cache_data
-
+        return self._get_snapshot()[1]
+
+    def get_status_json(self) -> bytes:
+        return self._get_snapshot()[2]
+
+    def _get_snapshot(self) -> Tuple[float, Dict[str, Any], bytes]:
+        snap = self._snapshot
+        if snap is not None and (time.time() - snap[0]) < self.refresh_seconds:
+            return snap
+
+        started = False
+        with self._refresh_lock:
+            fut = self._refresh_inflight
+            if fut is None:
+                fut = self._refresh_executor.submit(self._refresh)
+                self._refresh_inflight = fut
+                started = True
+        if started:
+            # Registered outside the lock: the callback runs inline if the future already finished.
+            fut.add_done_callback(self._on_refresh_done)
+
+        if snap is not None:
+            return snap
+        return fut.result()
+
+    def _refresh(self) -> Tuple[float, Dict[str, Any], bytes]:
         data = self._collect_status()
-        with self._cache_lock:
-            self._cache_data = data
-            self._cache_ts = time.time()
-        return data
+        return time.time(), data, _dumps(data)
 
-    def _collect_status(self) -> Dict[str, Any]:
-        results = []
-        with ThreadPoolExecutor(max_workers=min(16, max(1, len(self.devices)))) as ex:
-            future_map = {ex.submit(self._fetch_device, d): d for d in self.devices}
-            for fut in as_completed(future_map):
-                results.append(fut.result())
+    def _on_refresh_done(self, fut: Future) -> None:
+        if not fut.cancelled() and fut.exception() is None:
+            self._snapshot = fut.result()
+        with self._refresh_lock:
+            self._refresh_inflight = None
 
+    def _collect_status(self) -> Dict[str, Any]:
+        futures = {}
+        for device in self.devices:
+            # A fetch that outlived the previous deadline is reused rather than stacked.
+            fut = self._pending_fetches.pop(device.name, None)
+            if fut is None:
+                fut = self._submit_fetch(device)
+            futures[fut] = device
+        done, not_done = wait(futures, timeout=self._collect_deadline(), return_when=ALL_COMPLETED)
+
+        results = [fut.result() for fut in done]
+        for fut in not_done:
+            device = futures[fut]
+            self._pending_fetches[device.name] = fut
+            results.append(self._device_result(device, [], "timed out waiting for device", status="timeout"))
         results.sort(key=lambda x: str(x.get("name", "")))
+        updated_at = int(time.time())
         return {
-            "updated_at": int(time.time()),
+            "updated_at": updated_at,
+            "updated_at_iso": datetime.utcfromtimestamp(updated_at).isoformat() + "Z",
             "busy_memory_pct": self.busy_memory_pct,
             "busy_util_pct": self.busy_util_pct,
             "devices": results,
         }
 
+    def _collect_deadline(self) -> float:
+        return max(1, self.ssh_timeout_seconds - 1)
+
+    def _submit_fetch(self, device: Device) -> Future:
+        if asyncssh is not None:
+            return asyncio.run_coroutine_threadsafe(self._fetch_async(device), self._event_loop())
+        return self._pool.submit(self._fetch_device, device)
+
+    async def _fetch_async(self, device: Device) -> Dict[str, Any]:
+        key = self._client_key(device)
+        if not self._is_local(device) and self._async_usable(key):
+            # Half the collect deadline, leaving the rest for the paramiko fallback.
+            budget = self._collect_deadline() / 2
+            try:
+                stdout = await asyncio.wait_for(self._exec_async(device), budget)
+                self._async_retry.pop(key, None)
+                return self._device_result(device, self._parse_nvidia_smi(stdout), None)
+            except RuntimeError as exc:
+                self._async_retry.pop(key, None)
+                return self._device_result(device, [], str(exc))
+            except Exception as exc:  # noqa: BLE001
+                self._async_failure(key, exc)
+                self._drop_async(key)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, self._fetch_device, device)
+
+    def _async_usable(self, key: str) -> bool:
+        if key in self._async_failed:
+            return False
+        retry = self._async_retry.get(key)
+        return retry is None or time.monotonic() >= retry[0]
+
+    def _async_failure(self, key: str, exc: Exception) -> None:
+        auth_errors = (
+            asyncssh.PermissionDenied,
+            asyncssh.KeyImportError,
+            asyncssh.KeyEncryptionError,
+            FileNotFoundError,
+            PermissionError,
+        )
+        if isinstance(exc, auth_errors):
+            # Rejected credentials or unusable key files will not fix themselves.
+            self._async_failed.add(key)
+            return
+        _, delay = self._async_retry.get(key, (0.0, ASYNC_RETRY_MIN_SECONDS / 2))
+        delay = min(delay * 2, ASYNC_RETRY_MAX_SECONDS)
+        self._async_retry[key] = (time.monotonic() + delay, delay)
+
     def _fetch_device(self, device: Device) -> Dict[str, Any]:
         try:
-            stdout = self._exec_nvidia_smi(device)
-            gpus = self._parse_nvidia_smi(stdout)
-            for gpu in gpus:
-                gpu["busy"] = self._is_busy(gpu)
-            status = "ok"
-            error = None
+            if self._is_local(device) and _nvml_available():
+                gpus = self._fetch_local_direct()
+            else:
+                stdout = self._exec_nvidia_smi(device)
+                gpus = self._parse_nvidia_smi(stdout)
         except Exception as exc:  # noqa: BLE001
-            gpus = []
-            status = "error"
-            error = str(exc)
+            return self._device_result(device, [], str(exc))
+        return self._device_result(device, gpus, None)
 
+    @staticmethod
+    def _device_result(
+        device: Device, gpus: List[Dict[str, Any]], error: Optional[str], status: Optional[str] = None
+    ) -> Dict[str, Any]:
         return {
             "name": device.name,
             "host": device.host,
-            "status": status,
+            "status": status or ("error" if error is not None else "ok"),
             "error": error,
             "gpus": gpus,
         }
 
+    async def _exec_async(self, device: Device) -> str:
+        key = self._client_key(device)
+        lock = self._async_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            shell = self._async_shells.get(key)
+            if shell is not None:
+                try:
+                    return await self._run_async(shell)
+                except (OSError, EOFError, asyncssh.Error):
+                    self._drop_async(key)
+            if key not in self._async_conns:
+                self._async_conns[key] = await self._connect_async(device)
+            shell = await self._open_async_shell(self._async_conns[key])
+            self._async_shells[key] = shell
+            return await self._run_async(shell)
+
+    async def _connect_async(self, device: Device) -> Any:
+        agent = None
+        if device.key_paths:
+            client_keys: Any = list(device.key_paths)
+        elif device.look_for_keys:
+            client_keys = ()
+        elif device.allow_agent and os.environ.get("SSH_AUTH_SOCK"):
+            # () would also load ~/.ssh keys and None turns the agent off, so pass the agent's keys.
+            agent = await asyncssh.connect_agent()
+            client_keys = list(await agent.get_keys()) or None
+        else:
+            client_keys = None
+        try:
+            return await asyncssh.connect(
+                device.host,
+                port=device.port,
+                username=device.user,
+                password=self._device_password(device),
+                passphrase=self._device_passphrase(device),
+                client_keys=client_keys,
+                agent_path=() if device.allow_agent and agent is None else None,
+                known_hosts=None,
+                keepalive_interval=30,
+                connect_timeout=self.ssh_timeout_seconds,
+                login_timeout=self.ssh_timeout_seconds,
+            )
+        finally:
+            if agent is not None:
+                agent.close()
+
+    async def _open_async_shell(self, conn: Any) -> Any:
+        # Same model as _open_shell: one plain sh per connection, stderr folded into stdout.
+        shell = await conn.create_process("sh", stderr=asyncssh.STDOUT, encoding=None)
+        await self._async_roundtrip(shell, REMOTE_DAEMON_CMD)
+        return shell
+
+    async def _run_async(self, shell: Any) -> str:
+        output, exit_code = await self._async_roundtrip(shell, REMOTE_QUERY)
+        if exit_code != 0:
+            raise RuntimeError(output.strip() or f"nvidia-smi exited with status {exit_code}")
+        if not output.strip():
+            raise RuntimeError("nvidia-smi returned no output")
+        return output
+
+    @staticmethod
+    async def _async_roundtrip(shell: Any, command: str) -> Tuple[str, int]:
+        shell.stdin.write(f"{command}\necho {SHELL_SENTINEL.decode()}$?\n".encode())
+        buf = b""
+        match = None
+        while match is None:
+            chunk = await shell.stdout.read(65536)
+            if not chunk:
+                raise EOFError("SSH shell closed")
+            buf += chunk
+            if SHELL_SENTINEL in buf:
+                match = SHELL_SENTINEL_RE.search(buf)
+        return buf[: match.start()].decode("utf-8", errors="replace"), int(match.group(1))
+
+    def _drop_async(self, key: str) -> None:
+        shell = self._async_shells.pop(key, None)
+        if shell is not None:
+            shell.close()
+        conn = self._async_conns.pop(key, None)
+        if conn is not None:
+            conn.close()
+
     def _exec_nvidia_smi(self, device: Device) -> str:
-        if device.host in ("localhost", "127.0.0.1", socket.gethostname()):
+        if self._is_local(device):
             return self._exec_local()
 
+        return self._exec_ssh(device, password=self._device_password(device))
+
+    @staticmethod
+    def _device_password(device: Device) -> Optional[str]:
         password = os.environ.get(device.password_env or "") if device.password_env else None
-        if not password:
-            password = device.password
-        return self._exec_ssh(device, password=password)
+        return password or device.password
+
+    @staticmethod
+    def _device_passphrase(device: Device) -> Optional[str]:
+        passphrase = (
+            os.environ.get(device.key_passphrase_env or "") if device.key_passphrase_env else None
+        )
+        return passphrase or device.key_passphrase
+
+    def _is_local(self, device: Device) -> bool:
+        return device.host in self._local_names
+
+    def _fetch_local_direct(self) -> List[Dict[str, Any]]:
+        def _field(getter: Any, *args: Any) -> Any:
+            # Mirror nvidia-smi's [N/A] -> 0 for fields a board or MIG mode does not support.
+            try:
+                return getter(*args)
+            except pynvml.NVMLError:
+                return None
+
+        gpus = []
+        for index in range(pynvml.nvmlDeviceGetCount()):
+            handle = pynvml.nvmlDeviceGetHandleByIndex(index)
+            name = _field(pynvml.nvmlDeviceGetName, handle) or ""
+            uuid = _field(pynvml.nvmlDeviceGetUUID, handle) or ""
+            util = _field(pynvml.nvmlDeviceGetUtilizationRates, handle)
+            mem = _field(pynvml.nvmlDeviceGetMemoryInfo, handle)
+            temp = _field(pynvml.nvmlDeviceGetTemperature, handle, pynvml.NVML_TEMPERATURE_GPU)
+            gpu = {
+                "index": index,
+                "name": name.decode() if isinstance(name, bytes) else name,
+                "uuid": uuid.decode() if isinstance(uuid, bytes) else uuid,
+                "utilization_gpu": int(util.gpu) if util is not None else 0,
+                "memory_total_mb": int(mem.total // (1024 * 1024)) if mem is not None else 0,
+                "memory_used_mb": int(mem.used // (1024 * 1024)) if mem is not None else 0,
+                "temperature_c": int(temp) if temp is not None else 0,
+            }
+            gpu["memory_used_pct"] = self._percent(
+                gpu["memory_used_mb"], gpu["memory_total_mb"]
+            )
+            gpu["busy"] = self._is_busy(gpu)
+            gpus.append(gpu)
+        return gpus
 
     def _exec_local(self) -> str:
         import subprocess
@@ -158,16 +575,28 @@ class Monitor:
         return proc.stdout
 
     def _exec_ssh(self, device: Device, password: Optional[str]) -> str:
-        key_passphrase = (
-            os.environ.get(device.key_passphrase_env or "") if device.key_passphrase_env else None
-        )
-        if not key_passphrase:
-            key_passphrase = device.key_passphrase
+        key = self._client_key(device)
+        with self._ssh_locks.setdefault(key, threading.Lock()):
+            client = self._ssh_clients.get(key)
+            if client is not None:
+                transport = client.get_transport()
+                if transport is not None and transport.is_active():
+                    try:
+                        return self._run_ssh_command(device, client)
+                    except (OSError, EOFError, paramiko.SSHException):
+                        pass
+                self._drop_client(key)
+            return self._connect_and_exec(device, password)
+
+    def _connect_and_exec(self, device: Device, password: Optional[str]) -> str:
+        key_passphrase = self._device_passphrase(device)
         last_error: Optional[Exception] = None
         if device.key_paths:
             for key_path in device.key_paths:
                 try:
                     return self._exec_ssh_with_key(device, key_path, key_passphrase)
+                except RemoteCommandError:
+                    raise
                 except paramiko.AuthenticationException as exc:
                     last_error = exc
                     continue
@@ -177,6 +606,8 @@ class Monitor:
             if device.allow_agent or device.look_for_keys:
                 try:
                     return self._exec_ssh_with_agent(device)
+                except RemoteCommandError:
+                    raise
                 except Exception as exc:  # noqa: BLE001
                     last_error = exc
             if password:
@@ -190,6 +621,8 @@ class Monitor:
             return self._exec_ssh_with_password(device, password)
         try:
             return self._exec_ssh_with_agent(device)
+        except RemoteCommandError:
+            raise
         except Exception as exc:  # noqa: BLE001
             last_error = exc
         try:
@@ -198,37 +631,31 @@ class Monitor:
             raise last_error from exc
 
     def _exec_ssh_with_key(self, device: Device, key_path: str, passphrase: Optional[str]) -> str:
-        client = paramiko.SSHClient()
-        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         pkey = self._load_private_key(key_path, passphrase)
-        try:
-            client.connect(
-                hostname=device.host,
-                port=device.port,
-                username=device.user,
-                pkey=pkey,
-                key_filename=None,
-                timeout=self.ssh_timeout_seconds,
-                banner_timeout=self.ssh_timeout_seconds,
-                auth_timeout=self.ssh_timeout_seconds,
-                allow_agent=False,
-                look_for_keys=False,
-                disabled_algorithms={"pubkeys": ["ssh-dss"]},
-            )
-            stdin, stdout, stderr = client.exec_command(NVIDIA_SMI_QUERY, timeout=self.ssh_timeout_seconds)
-            _ = stdin  # unused
-            output = stdout.read().decode("utf-8", errors="replace")
-            err = stderr.read().decode("utf-8", errors="replace")
-        finally:
-            client.close()
-
-        if err.strip() and not output.strip():
-            raise RuntimeError(err.strip())
-        if not output.strip():
-            raise RuntimeError("nvidia-smi returned no output")
-        return output
+        client = self._get_or_connect(device, pkey=pkey, **_NO_AGENT)
+        return self._run_ssh_command(device, client)
 
     def _exec_ssh_with_password(self, device: Device, password: str) -> str:
+        client = self._get_or_connect(device, password=password, **_NO_AGENT)
+        return self._run_ssh_command(device, client)
+
+    def _exec_ssh_with_agent(self, device: Device) -> str:
+        client = self._get_or_connect(
+            device,
+            allow_agent=device.allow_agent,
+            look_for_keys=device.look_for_keys,
+        )
+        return self._run_ssh_command(device, client)
+
+    def _get_or_connect(self, device: Device, **auth_kwargs: Any) -> paramiko.SSHClient:
+        key = self._client_key(device)
+        client = self._ssh_clients.get(key)
+        if client is not None:
+            transport = client.get_transport()
+            if transport is not None and transport.is_active():
+                return client
+            self._drop_client(key)
+
         client = paramiko.SSHClient()
         client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         try:
@@ -236,57 +663,119 @@ class Monitor:
                 hostname=device.host,
                 port=device.port,
                 username=device.user,
-                password=password,
-                key_filename=None,
                 timeout=self.ssh_timeout_seconds,
                 banner_timeout=self.ssh_timeout_seconds,
                 auth_timeout=self.ssh_timeout_seconds,
-                allow_agent=False,
-                look_for_keys=False,
-                disabled_algorithms={"pubkeys": ["ssh-dss"]},
+                **_CONNECT_COMMON,
+                **auth_kwargs,
             )
-            stdin, stdout, stderr = client.exec_command(NVIDIA_SMI_QUERY, timeout=self.ssh_timeout_seconds)
-            _ = stdin  # unused
-            output = stdout.read().decode("utf-8", errors="replace")
-            err = stderr.read().decode("utf-8", errors="replace")
-        finally:
+        except Exception:
             client.close()
-
-        if err.strip() and not output.strip():
-            raise RuntimeError(err.strip())
+            raise
+        transport = client.get_transport()
+        if transport is not None:
+            transport.set_keepalive(30)
+        self._ssh_clients[key] = client
+        self._ensure_remote_daemon(client)
+        return client
+
+    def _ensure_remote_daemon(self, client: paramiko.SSHClient) -> None:
+        try:
+            stdin, stdout, stderr = client.exec_command(REMOTE_DAEMON_CMD_SH, timeout=self.ssh_timeout_seconds)
+            _ = stdin, stderr  # unused
+            stdout.channel.status_event.wait(self.ssh_timeout_seconds)
+            stdout.channel.close()
+        except Exception:  # noqa: BLE001
+            pass
+
+    def _run_ssh_command(self, device: Device, client: paramiko.SSHClient) -> str:
+        key = self._client_key(device)
+        try:
+            shell = self._ssh_shells.get(key)
+            if shell is None or shell.closed:
+                shell = self._open_shell(client)
+                self._ssh_shells[key] = shell
+            return self._run_in_shell(shell)
+        except (OSError, EOFError, paramiko.SSHException):
+            self._drop_shell(key)
+        return self._exec_command(client)
+
+    def _open_shell(self, client: paramiko.SSHClient) -> paramiko.Channel:
+        transport = client.get_transport()
+        if transport is None or not transport.is_active():
+            raise paramiko.SSHException("SSH transport is not active")
+        # Run plain sh rather than the login shell: POSIX syntax, no pty, no echo or prompt.
+        shell = transport.open_session(timeout=self.ssh_timeout_seconds)
+        shell.settimeout(self.ssh_timeout_seconds)
+        shell.exec_command("sh")
+        self._shell_roundtrip(shell, "true")
+        return shell
+
+    def _run_in_shell(self, shell: paramiko.Channel) -> str:
+        output, exit_code, err = self._shell_roundtrip(shell, REMOTE_QUERY)
+        if exit_code != 0:
+            raise RemoteCommandError(err.strip() or output.strip() or f"nvidia-smi exited with status {exit_code}")
         if not output.strip():
-            raise RuntimeError("nvidia-smi returned no output")
+            raise RemoteCommandError("nvidia-smi returned no output")
         return output
 
-    def _exec_ssh_with_agent(self, device: Device) -> str:
-        client = paramiko.SSHClient()
-        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        try:
-            client.connect(
-                hostname=device.host,
-                port=device.port,
-                username=device.user,
-                key_filename=None,
-                timeout=self.ssh_timeout_seconds,
-                banner_timeout=self.ssh_timeout_seconds,
-                auth_timeout=self.ssh_timeout_seconds,
-                allow_agent=device.allow_agent,
-                look_for_keys=device.look_for_keys,
-                disabled_algorithms={"pubkeys": ["ssh-dss"]},
-            )
-            stdin, stdout, stderr = client.exec_command(NVIDIA_SMI_QUERY, timeout=self.ssh_timeout_seconds)
-            _ = stdin  # unused
-            output = stdout.read().decode("utf-8", errors="replace")
-            err = stderr.read().decode("utf-8", errors="replace")
-        finally:
-            client.close()
+    @staticmethod
+    def _shell_roundtrip(shell: paramiko.Channel, command: str) -> Tuple[str, int, str]:
+        while shell.recv_stderr_ready():
+            shell.recv_stderr(65536)
+        shell.sendall(f"{command}\necho {SHELL_SENTINEL.decode()}$?\n".encode())
+        buf = b""
+        match = None
+        while match is None:
+            chunk = shell.recv(65536)
+            if not chunk:
+                raise EOFError("SSH shell closed")
+            buf += chunk
+            if SHELL_SENTINEL in buf:
+                match = SHELL_SENTINEL_RE.search(buf)
+        err = b""
+        while shell.recv_stderr_ready():
+            err += shell.recv_stderr(65536)
+        return (
+            buf[: match.start()].decode("utf-8", errors="replace"),
+            int(match.group(1)),
+            err.decode("utf-8", errors="replace"),
+        )
 
-        if err.strip() and not output.strip():
-            raise RuntimeError(err.strip())
+    def _exec_command(self, client: paramiko.SSHClient) -> str:
+        stdin, stdout, stderr = client.exec_command(REMOTE_QUERY_CMD, timeout=self.ssh_timeout_seconds)
+        _ = stdin  # unused
+        output = stdout.read().decode("utf-8", errors="replace")
+        err = stderr.read().decode("utf-8", errors="replace")
+        exit_code = stdout.channel.recv_exit_status()
+
+        if exit_code != 0:
+            raise RemoteCommandError(err.strip() or output.strip() or f"nvidia-smi exited with status {exit_code}")
         if not output.strip():
-            raise RuntimeError("nvidia-smi returned no output")
+            raise RemoteCommandError("nvidia-smi returned no output")
         return output
 
+    def _drop_shell(self, key: str) -> None:
+        shell = self._ssh_shells.pop(key, None)
+        if shell is not None:
+            try:
+                shell.close()
+            except Exception:  # noqa: BLE001
+                pass
+
+    def _drop_client(self, key: str) -> None:
+        self._drop_shell(key)
+        client = self._ssh_clients.pop(key, None)
+        if client is not None:
+            try:
+                client.close()
+            except Exception:  # noqa: BLE001
+                pass
+
+    @staticmethod
+    def _client_key(device: Device) -> str:
+        return f"{device.user}@{device.host}:{device.port}"
+
     def _exec_ssh_system(self, device: Device) -> str:
         import subprocess
 
@@ -319,35 +808,70 @@ class Monitor:
 
     @staticmethod
     def _load_private_key(key_path: str, passphrase: Optional[str]) -> paramiko.PKey:
+        cache_key = (key_path, hash(passphrase) if passphrase else 0, os.stat(key_path).st_mtime)
+        pkey = _PKEY_CACHE.get(cache_key)
+        if pkey is not None:
+            return pkey
+
+        with open(key_path, "r", encoding="utf-8", errors="replace") as f:
+            header = f.readline()
+        key_classes = [paramiko.RSAKey, paramiko.Ed25519Key, paramiko.ECDSAKey]
+        if "OPENSSH" in header:
+            key_classes = [paramiko.Ed25519Key, paramiko.RSAKey, paramiko.ECDSAKey]
+        elif "EC PRIVATE" in header:
+            key_classes = [paramiko.ECDSAKey, paramiko.RSAKey, paramiko.Ed25519Key]
+
         key_errors = []
-        for key_cls in (paramiko.RSAKey, paramiko.Ed25519Key, paramiko.ECDSAKey):
+        for key_cls in key_classes:
             try:
-                return key_cls.from_private_key_file(key_path, password=passphrase)
+                pkey = key_cls.from_private_key_file(key_path, password=passphrase)
             except Exception as exc:  # noqa: BLE001
                 key_errors.append(f"{key_cls.__name__}: {exc}")
+                continue
+            _PKEY_CACHE[cache_key] = pkey
+            return pkey
         msg = "Unsupported or unreadable key. DSA keys are not supported. Errors: " + " | ".join(key_errors)
         raise RuntimeError(msg)
 
     def _parse_nvidia_smi(self, stdout: str) -> List[Dict[str, Any]]:
+        def _i(value: str) -> int:
+            value = value.strip()
+            return int(value) if value.isdigit() else 0
+
+        busy_mem = self.busy_memory_pct
+        busy_util = self.busy_util_pct
+        rows = [row for row in csv.reader(io.StringIO(stdout), skipinitialspace=True) if len(row) >= 7]
+        vectorize = np is not None and len(rows) >= NUMPY_MIN_GPUS
         gpus = []
-        for line in stdout.strip().splitlines():
-            parts = [p.strip() for p in line.split(",")]
-            if len(parts) < 7:
-                continue
-            index, name, uuid, util, mem_total, mem_used, temp = parts[:7]
-            gpu = {
-                "index": int(index),
-                "name": name,
-                "uuid": uuid,
-                "utilization_gpu": self._to_int(util),
-                "memory_total_mb": self._to_int(mem_total),
-                "memory_used_mb": self._to_int(mem_used),
-                "temperature_c": self._to_int(temp),
-            }
-            gpu["memory_used_pct"] = self._percent(
-                gpu["memory_used_mb"], gpu["memory_total_mb"]
+        for row in rows:
+            util = _i(row[3])
+            mem_total = _i(row[4])
+            mem_used = _i(row[5])
+            mem_pct = 0 if mem_total <= 0 else (mem_used * 100 + mem_total // 2) // mem_total
+            gpus.append(
+                dict(
+                    zip(
+                        _GPU_KEYS,
+                        (
+                            int(row[0]),
+                            row[1].strip(),
+                            row[2].strip(),
+                            util,
+                            mem_total,
+                            mem_used,
+                            _i(row[6]),
+                            mem_pct,
+                            False if vectorize else (mem_pct >= busy_mem or util >= busy_util),
+                        ),
+                    )
+                )
             )
-            gpus.append(gpu)
+        if vectorize:
+            util_arr = np.fromiter((g["utilization_gpu"] for g in gpus), dtype=np.int16, count=len(gpus))
+            mem_pct_arr = np.fromiter((g["memory_used_pct"] for g in gpus), dtype=np.int16, count=len(gpus))
+            busy_mask = (mem_pct_arr >= busy_mem) | (util_arr >= busy_util)
+            for gpu, busy in zip(gpus, busy_mask.tolist()):
+                gpu["busy"] = busy
         return gpus
 
     def _is_busy(self, gpu: Dict[str, Any]) -> bool:
@@ -355,15 +879,8 @@ class Monitor:
         util = gpu.get("utilization_gpu", 0)
         return mem_pct >= self.busy_memory_pct or util >= self.busy_util_pct
 
-    @staticmethod
-    def _to_int(value: str) -> int:
-        try:
-            return int(float(value))
-        except Exception:
-            return 0
-
     @staticmethod
     def _percent(used: int, total: int) -> int:
         if total <= 0:
             return 0
-        return int(round((used / total) * 100))
+        return (used * 100 + total // 2) // total